@@ -85,6 +85,7 @@ def read_tsv_glue(tsv_file, num_skip=1, keep_column_names=False):
 
 def read_jsonl_superglue(jsonl_file):
     columns = None
+    columns_set = None
     out = []
     with open(jsonl_file, 'r') as f:
         for i, line in enumerate(f):
@@ -92,8 +93,9 @@ def read_jsonl_superglue(jsonl_file):
             sample = json.loads(line)
             if columns is None:
                 columns = list(sample.keys())
+                columns_set = set(columns)
             else:
-                assert sorted(columns) == sorted(list(sample.keys())),\
+                assert columns_set == set(sample.keys()),\
                     'Columns={}, sample.keys()={}'.format(columns, sample.keys())
             out.append([sample[col] for col in columns])
     df = pd.DataFrame(out, columns=columns)
@@ -35,9 +35,9 @@ class CfgNode(yacs.config.CfgNode):
             {'A.aaa': 1, 'A.bbb': 2, 'B.ccc': 3}
         """
 
-        def convert_to_dict(cfg_node, key_list):
-            from yacs.config import _assert_with_logging, _valid_type, _VALID_TYPES
+        from yacs.config import _assert_with_logging, _valid_type, _VALID_TYPES
 
+        def convert_to_dict(cfg_node, key_list):
             if not isinstance(cfg_node, CfgNode):
                 _assert_with_logging(
                     _valid_type(cfg_node),
@@ -48,8 +48,7 @@ class CfgNode(yacs.config.CfgNode):
                 return cfg_node
             else:
                 new_dict = dict()
-                for k in cfg_node:
-                    v = getattr(cfg_node, k)
+                for k, v in cfg_node.items():
                     sub_dict = convert_to_dict(v, key_list + [k])
                     if isinstance(sub_dict, dict):
                         for ck, cv in sub_dict.items():
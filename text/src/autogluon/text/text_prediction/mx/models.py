@@ -13,7 +13,7 @@ import pickle
 import functools
 import tqdm
 import shutil
-import uuid
+import tempfile
 from typing import Tuple
 from packaging import version as py_version
 
@@ -1051,8 +1051,8 @@ class MultiModalTextModel:
         # Create a temporary cache file. The internal train function will load the
         # temporary cache.
         # In fact, we may generalize this functionality to create the cache in S3/FSx.
-        cache_path = os.path.join(self._output_directory, f'cache_{uuid.uuid4()}')
-        os.makedirs(cache_path)
+        cache_dir = tempfile.TemporaryDirectory(prefix='cache_', dir=self._output_directory)
+        cache_path = cache_dir.name
         train_df_path = os.path.join(cache_path, 'cache_train_dataframe.pd.pkl')
         tuning_df_path = os.path.join(cache_path, 'cache_tuning_dataframe.pd.pkl')
         train_data.to_pickle(train_df_path)
@@ -1206,7 +1206,7 @@ class MultiModalTextModel:
         mx.npx.waitall()
 
         # Clean cache, will directly raise
-        shutil.rmtree(cache_path)
+        cache_dir.cleanup()
         # Clean up the temporary workspace that stores the configuration/weights of the best model
         try:
             shutil.rmtree(best_model_saved_dir_path)
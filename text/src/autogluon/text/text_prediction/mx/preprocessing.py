@@ -257,14 +257,15 @@ def get_stats_string(processor, dataset, is_train=False):
 
 
 def get_cls_sep_id(tokenizer):
-    if hasattr(tokenizer.vocab, 'cls_id'):
-        cls_id = tokenizer.vocab.cls_id
-        sep_id = tokenizer.vocab.sep_id
-    elif hasattr(tokenizer.vocab, 'bos_id'):
-        cls_id = tokenizer.vocab.bos_id
-        sep_id = tokenizer.vocab.eos_id
+    vocab = tokenizer.vocab
+    cls_id = getattr(vocab, 'cls_id', None)
+    if cls_id is not None:
+        sep_id = vocab.sep_id
     else:
-        raise NotImplementedError
+        cls_id = getattr(vocab, 'bos_id', None)
+        if cls_id is None:
+            raise NotImplementedError
+        sep_id = vocab.eos_id
     return cls_id, sep_id
 
 
@@ -273,10 +273,11 @@ class TextPredictor:
             hyperparameters = merge_params(existing_hparams, hyperparameters)
             # Check that the merged hyperparameters matches with the existing hyperparameters.
             # Here, we ensure that the model configurations remain the same.
-            for key in hyperparameters['models']['MultimodalTextModel']['search_space']:
-                if key in existing_hparams and (key.startswith('model.') or key.startswith('preprocessing.')):
-                    new_value = hyperparameters['models']['MultimodalTextModel']['search_space'][key]
-                    old_value = existing_hparams['models']['MultimodalTextModel']['search_space'][key]
+            new_search_space = hyperparameters['models']['MultimodalTextModel']['search_space']
+            old_search_space = existing_hparams['models']['MultimodalTextModel']['search_space']
+            for key, new_value in new_search_space.items():
+                if key in old_search_space and (key.startswith('model.') or key.startswith('preprocessing.')):
+                    old_value = old_search_space[key]
                     assert new_value == old_value,\
                         f'The model architecture / preprocessing logic is not allowed to change in the ' \
                         f'continue training mode. ' \
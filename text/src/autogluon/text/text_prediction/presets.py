@@ -231,10 +231,15 @@ def merge_params(base_params, partial_params=None):
         if not isinstance(partial_params, dict):
             return partial_params
         assert isinstance(base_params, dict)
-        final_params = copy.deepcopy(base_params)
-        for key in partial_params:
-            if key in base_params:
-                final_params[key] = merge_params(base_params[key], partial_params[key])
+        # Only deep-copy the subtrees that are kept as-is; subtrees that get
+        # merged or overridden would make the copy redundant.
+        final_params = dict()
+        for key, base_value in base_params.items():
+            if key in partial_params:
+                final_params[key] = merge_params(base_value, partial_params[key])
             else:
+                final_params[key] = copy.deepcopy(base_value)
+        for key in partial_params:
+            if key not in base_params:
                 final_params[key] = partial_params[key]
         return final_params
@@ -0,0 +1,23 @@
+import pytest
+from autogluon.core.utils.loaders import load_pd
+
+
+@pytest.fixture(scope='session')
+def sst_dataset():
+    # Download and parse the sst data once per pytest session; every test
+    # module that needs it shares the same train/dev dataframes.
+    train_data = load_pd.load('https://autogluon-text.s3-accelerate.amazonaws.com/'
+                              'glue/sst/train.parquet')
+    dev_data = load_pd.load('https://autogluon-text.s3-accelerate.amazonaws.com/'
+                            'glue/sst/dev.parquet')
+    return train_data, dev_data
+
+
+@pytest.fixture(scope='session')
+def sts_dataset():
+    # Download and parse the sts data once per pytest session.
+    train_data = load_pd.load('https://autogluon-text.s3-accelerate.amazonaws.com/'
+                              'glue/sts/train.parquet')
+    dev_data = load_pd.load('https://autogluon-text.s3-accelerate.amazonaws.com/'
+                            'glue/sts/dev.parquet')
+    return train_data, dev_data
